@@ -11,7 +11,18 @@ from ._sentrystr import (
     SentryStrError,
     Stacktrace,
     User,
+    generate_keypair,
+    generate_keypairs,
+    hex_to_npub,
+    npub_to_hex,
 )
+from .aio import (
+    capture_event_async,
+    capture_events_async,
+    capture_message_async,
+    send_direct_message_async,
+)
+from .batch import EventBatch, bulk_capture
 from .handler import (
     SentryStrHandler,
     SentryStrLoggingHandle,
@@ -29,6 +40,16 @@ __all__ = [
     "User",
     "Request",
     "SentryStrError",
+    "generate_keypair",
+    "generate_keypairs",
+    "npub_to_hex",
+    "hex_to_npub",
+    "EventBatch",
+    "bulk_capture",
+    "capture_event_async",
+    "capture_events_async",
+    "capture_message_async",
+    "send_direct_message_async",
     "SentryStrHandler",
     "SentryStrLoggingHandle",
     "install_sentrystr_logging",
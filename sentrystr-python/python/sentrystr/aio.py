@@ -0,0 +1,49 @@
+"""asyncio front-end for :class:`NostrSentryClient`.
+
+The capture methods on :class:`NostrSentryClient` block until the relays have
+acknowledged the event, but they release the GIL while they wait and any
+number of threads may publish through one client at once. The coroutines here
+run those calls on the event loop's default executor, so a coroutine can
+``await`` a capture without stalling the loop, and several captures gathered
+with :func:`asyncio.gather` overlap instead of running back to back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, Callable, Sequence, TypeVar
+
+__all__ = [
+    "capture_event_async",
+    "capture_events_async",
+    "capture_message_async",
+    "send_direct_message_async",
+]
+
+_T = TypeVar("_T")
+
+
+async def _run_blocking(func: Callable[..., _T], *args: Any) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+async def capture_event_async(client: Any, event: Any) -> None:
+    """Await :meth:`NostrSentryClient.capture_event` without blocking the loop."""
+    await _run_blocking(client.capture_event, event)
+
+
+async def capture_events_async(client: Any, events: Sequence[Any]) -> None:
+    """Await :meth:`NostrSentryClient.capture_events` without blocking the loop."""
+    await _run_blocking(client.capture_events, list(events))
+
+
+async def capture_message_async(client: Any, message: str) -> None:
+    """Await :meth:`NostrSentryClient.capture_message` without blocking the loop."""
+    await _run_blocking(client.capture_message, message)
+
+
+async def send_direct_message_async(client: Any, content: str) -> None:
+    """Await :meth:`NostrSentryClient.send_direct_message` without blocking the loop."""
+    await _run_blocking(client.send_direct_message, content)
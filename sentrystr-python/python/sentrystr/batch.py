@@ -0,0 +1,91 @@
+"""Batched capture for bursts of SentryStr events.
+
+:func:`bulk_capture` collects events built inside a ``with`` block and sends
+them with a single :meth:`NostrSentryClient.capture_events` call when the block
+exits, so the relay publishes overlap instead of running one after another.
+
+While the block runs, Python's cyclic garbage collector is paused. Building a
+burst of events allocates many short-lived extension objects, and each
+generation-0 collection triggered along the way would walk all of them for no
+benefit; reference counting still frees them as usual.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import threading
+from typing import Any, Iterator
+
+__all__ = [
+    "EventBatch",
+    "bulk_capture",
+]
+
+
+# The collector switch is process-wide, so overlapping blocks (in any thread)
+# share one pause: the first to enter disables GC and the last to exit
+# restores it.
+_gc_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+def _pause_gc() -> None:
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+
+
+def _resume_gc() -> None:
+    global _gc_pause_depth
+    with _gc_lock:
+        _gc_pause_depth -= 1
+        if _gc_pause_depth == 0 and _gc_was_enabled:
+            gc.enable()
+
+
+class EventBatch:
+    """Events collected by :func:`bulk_capture`, sent together on exit."""
+
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+
+    def add(self, event: Any) -> None:
+        self.events.append(event)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+@contextlib.contextmanager
+def bulk_capture(client: Any, *, pause_gc: bool = True) -> Iterator[EventBatch]:
+    """Collect events and capture them in one batch when the block exits.
+
+    Parameters
+    ----------
+    client:
+        The :class:`NostrSentryClient` to send through.
+    pause_gc:
+        Disable the cyclic garbage collector while the block runs. Blocks may
+        overlap, including across threads: GC stays off until the last one
+        exits, and is then re-enabled only if it was enabled when the first
+        one entered. Code that toggles GC itself while a block is open will
+        have its setting overridden on that last exit.
+
+    If the block raises, the collected events are discarded and the exception
+    propagates unchanged.
+    """
+    batch = EventBatch()
+    if pause_gc:
+        _pause_gc()
+    try:
+        yield batch
+    finally:
+        if pause_gc:
+            _resume_gc()
+    if batch.events:
+        client.capture_events(batch.events)
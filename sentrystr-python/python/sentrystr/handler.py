@@ -25,7 +25,6 @@ import contextlib
 import logging
 import logging.handlers
 import queue
-import secrets
 import time
 from typing import Any, Sequence, Union
 
@@ -34,6 +33,7 @@ from ._sentrystr import (
     Event,
     Level,
     NostrSentryClient,
+    generate_keypair,
 )
 from ._sentrystr import (
     Exception as SentryStrException,
@@ -48,6 +48,13 @@ __all__ = [
 LoggerLike = Union[str, logging.Logger]
 
 
+# ``Level`` is immutable, so one instance per name is shared by every event
+# instead of constructing a new extension object for each record.
+_LEVELS = {
+    name: Level(name) for name in ("debug", "info", "warning", "error", "fatal")
+}
+
+
 def _level_to_sentrystr(levelno: int) -> str:
     """Map a stdlib numeric log level to a SentryStr level string."""
     if levelno >= logging.CRITICAL:
@@ -119,9 +126,10 @@ class SentryStrHandler(logging.Handler):
                         "`client`."
                     )
                 # A bare hex key is accepted by SentryStr; generate an ephemeral
-                # identity when the caller does not supply one.
+                # identity when the caller does not supply one. The native
+                # keygen always yields a valid secp256k1 scalar.
                 config = Config(
-                    self._private_key or secrets.token_hex(32), self._relays
+                    self._private_key or generate_keypair()[0], self._relays
                 )
                 if self._recipient_pubkey:
                     config.with_nip44_encryption(self._recipient_pubkey)
@@ -143,23 +151,24 @@ class SentryStrHandler(logging.Handler):
     def _build_event(self, record: logging.LogRecord) -> Any:
         event = Event()
         event.platform = self._platform
-        event.level = Level(_level_to_sentrystr(record.levelno))
+        event.level = _LEVELS[_level_to_sentrystr(record.levelno)]
         event.message = self.format(record)
         event.logger = record.name
 
-        event.add_tag("level", record.levelname)
-        event.add_tag("logger_name", record.name)
+        # Collect tags and extras first and hand each over in a single call,
+        # rather than crossing into the extension once per field.
+        tags = {"level": record.levelname, "logger_name": record.name}
         if record.module:
-            event.add_tag("module", record.module)
+            tags["module"] = record.module
         if record.funcName:
-            event.add_tag("function", record.funcName)
+            tags["function"] = record.funcName
 
         request_id = getattr(record, "request_id", None)
         if request_id:
-            event.add_tag("request_id", str(request_id))
+            tags["request_id"] = str(request_id)
 
-        event.add_extra("pathname", record.pathname)
-        event.add_extra("lineno", record.lineno)
+        event.with_tags(tags)
+        event.add_extras({"pathname": record.pathname, "lineno": record.lineno})
 
         # When a QueueHandler has already flattened the record, exc_info is gone
         # and the traceback lives in the formatted message. When present, also
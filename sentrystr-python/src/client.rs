@@ -1,69 +1,177 @@
-// The `MutexGuard` on `inner` is held across `.await`, but only inside
+// The `RwLock` guard on `inner` is held across `.await`, but only inside
 // `runtime.block_on`, which drives the future to completion on the calling
 // thread and releases the guard before returning. No async task is ever
-// suspended while holding it, so concurrent callers simply serialize on the
-// mutex (there is no deadlock risk). Allow the lint for this module.
+// suspended while holding it. Publishing only needs shared access, so any
+// number of threads can capture concurrently; only reconfiguring direct
+// messaging takes the write lock. Allow the lint for this module.
 #![allow(clippy::await_holding_lock)]
 
+use nostr::PublicKey;
 use pyo3::prelude::*;
-use std::sync::{Arc, Mutex};
-use tokio::runtime::Runtime;
+use pyo3::types::PyBytes;
+use std::sync::{Arc, Mutex, RwLock};
+use tokio::runtime::{Builder, Runtime};
 
 use crate::{PyConfig, PyEvent};
-use sentrystr::NostrSentryClient;
+use nostr_sdk::Client;
+use sentrystr::{DirectMessageBuilder, NostrSentryClient};
+
+/// Worker threads for the shared runtime. The workers only drive the relay
+/// connection tasks; the publishing itself runs on the calling thread inside
+/// `block_on`, so a small fixed pool is enough regardless of core count.
+const RUNTIME_WORKER_THREADS: usize = 2;
+
+/// The shared runtime and the PID of the process that built it. A runtime's
+/// worker threads do not survive `fork()`, so a prefork child (gunicorn,
+/// celery, multiprocessing) that inherited the parent's runtime must build its
+/// own instead of spawning relay tasks nobody will ever poll.
+static RUNTIME: Mutex<Option<(u32, &'static Runtime)>> = Mutex::new(None);
+
+/// Returns the runtime shared by every `NostrSentryClient` in this process,
+/// building it on first use and again after a fork.
+fn shared_runtime() -> PyResult<&'static Runtime> {
+    let pid = std::process::id();
+    // A thread that panicked while holding the lock cannot have left a
+    // half-written slot, so a poisoned lock is still safe to use.
+    let mut slot = RUNTIME.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some((owner, runtime)) = *slot
+        && owner == pid
+    {
+        return Ok(runtime);
+    }
+    let runtime = Builder::new_multi_thread()
+        .worker_threads(RUNTIME_WORKER_THREADS)
+        .enable_all()
+        .build()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    // Leaked on purpose: clients hold `&'static` references, and a runtime
+    // inherited across a fork must never be dropped, since shutting it down
+    // would wait on worker threads that do not exist in the child.
+    let runtime: &'static Runtime = Box::leak(Box::new(runtime));
+    *slot = Some((pid, runtime));
+    Ok(runtime)
+}
 
 #[pyclass(name = "NostrSentryClient")]
 pub struct PyNostrSentryClient {
-    inner: Arc<Mutex<NostrSentryClient>>,
-    runtime: Arc<Runtime>,
+    inner: Arc<RwLock<NostrSentryClient>>,
+    runtime: &'static Runtime,
+    // Copied out at construction so reading them never contends on `inner`,
+    // whose read lock a throttled capture can hold for a long time.
+    public_key: PublicKey,
+    relay_client: Client,
 }
 
 #[pymethods]
 impl PyNostrSentryClient {
     #[new]
     pub fn new(py: Python<'_>, config: &PyConfig) -> PyResult<Self> {
-        let runtime = Arc::new(
-            Runtime::new()
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?,
-        );
+        let runtime = shared_runtime()?;
 
         // Clone the plain config out of the pyclass so the closure captures only
         // `Ungil` data, then release the GIL: connecting to relays is a blocking
         // network round-trip and must not freeze other Python threads.
         let config = config.inner().clone();
-        let rt = runtime.clone();
         let client = py
-            .detach(move || rt.block_on(NostrSentryClient::new(config)))
+            .detach(move || runtime.block_on(NostrSentryClient::new(config)))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
         Ok(Self {
-            inner: Arc::new(Mutex::new(client)),
+            public_key: client.public_key(),
+            relay_client: client.relay_client().clone(),
+            inner: Arc::new(RwLock::new(client)),
             runtime,
         })
     }
 
+    /// Create a client that publishes under `config`'s keys over `client`'s
+    /// already-open relay connections instead of connecting again.
+    ///
+    /// The connections still belong to `client`: relays that require NIP-42
+    /// AUTH see `client`'s identity, and may refuse events this client signs
+    /// under a different key.
+    #[staticmethod]
+    pub fn from_client(config: &PyConfig, client: &PyNostrSentryClient) -> PyResult<Self> {
+        let sentry =
+            NostrSentryClient::from_client(config.inner().clone(), client.relay_client.clone())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+        Ok(Self {
+            public_key: sentry.public_key(),
+            relay_client: sentry.relay_client().clone(),
+            inner: Arc::new(RwLock::new(sentry)),
+            // The connection tasks run on the runtime that opened them.
+            runtime: client.runtime,
+        })
+    }
+
+    /// Hex-encoded public key that events are published under.
+    #[getter]
+    pub fn public_key(&self) -> String {
+        self.public_key.to_hex()
+    }
+
+    /// Raw 32-byte public key, for callers that do not need the hex form.
+    #[getter]
+    pub fn public_key_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.public_key.to_bytes())
+    }
+
+    /// URLs of the configured relays that currently have an open connection.
+    pub fn connected_relays(&self, py: Python<'_>) -> Vec<String> {
+        let inner = self.inner.clone();
+        let runtime = self.runtime;
+        py.detach(move || {
+            runtime.block_on(async move {
+                let client = inner.read().unwrap();
+                client.connected_relays().await
+            })
+        })
+    }
+
     pub fn capture_event(&self, py: Python<'_>, event: &PyEvent) -> PyResult<()> {
         // Clone out of the pyclasses so the GIL-released closure captures only
         // `Send + Ungil` data. `PyErr` is `!Ungil`, so the blocking work returns
         // the native error and we build the `PyErr` after re-acquiring the GIL.
         let event = event.inner().clone();
         let inner = self.inner.clone();
-        let runtime = self.runtime.clone();
+        let runtime = self.runtime;
         py.detach(move || {
             runtime.block_on(async move {
-                let client = inner.lock().unwrap();
+                let client = inner.read().unwrap();
                 client.capture_event(event).await.map(|_| ())
             })
         })
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
     }
 
+    pub fn capture_events(&self, py: Python<'_>, events: Vec<PyRef<'_, PyEvent>>) -> PyResult<()> {
+        // One FFI call and one GIL release for the whole batch; the sends then
+        // overlap on the runtime. Every event is attempted, and the first
+        // failure (if any) is raised once the batch has finished.
+        let events: Vec<sentrystr::Event> = events.iter().map(|e| e.inner().clone()).collect();
+        let inner = self.inner.clone();
+        let runtime = self.runtime;
+        py.detach(move || {
+            runtime.block_on(async move {
+                let client = inner.read().unwrap();
+                client
+                    .capture_events(events)
+                    .await
+                    .into_iter()
+                    .collect::<sentrystr::Result<Vec<_>>>()
+                    .map(|_| ())
+            })
+        })
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+    }
+
     pub fn capture_message(&self, py: Python<'_>, message: String) -> PyResult<()> {
         let inner = self.inner.clone();
-        let runtime = self.runtime.clone();
+        let runtime = self.runtime;
         py.detach(move || {
             runtime.block_on(async move {
-                let client = inner.lock().unwrap();
+                let client = inner.read().unwrap();
                 client.capture_message(&message).await.map(|_| ())
             })
         })
@@ -72,10 +180,10 @@ impl PyNostrSentryClient {
 
     pub fn capture_error(&self, py: Python<'_>, error: String) -> PyResult<()> {
         let inner = self.inner.clone();
-        let runtime = self.runtime.clone();
+        let runtime = self.runtime;
         py.detach(move || {
             runtime.block_on(async move {
-                let client = inner.lock().unwrap();
+                let client = inner.read().unwrap();
                 client.capture_error(&error).await.map(|_| ())
             })
         })
@@ -89,7 +197,7 @@ impl PyNostrSentryClient {
         message: Option<String>,
     ) -> PyResult<()> {
         let inner = self.inner.clone();
-        let runtime = self.runtime.clone();
+        let runtime = self.runtime;
         py.detach(move || {
             runtime.block_on(async move {
                 // Create a simple exception event instead
@@ -97,7 +205,7 @@ impl PyNostrSentryClient {
                     .with_message(message.unwrap_or_else(|| exception_type.clone()))
                     .with_level(sentrystr::Level::Error);
 
-                let client = inner.lock().unwrap();
+                let client = inner.read().unwrap();
                 client.capture_event(event).await.map(|_| ())
             })
         })
@@ -106,66 +214,46 @@ impl PyNostrSentryClient {
 
     pub fn send_direct_message(&self, py: Python<'_>, content: String) -> PyResult<()> {
         let inner = self.inner.clone();
-        let runtime = self.runtime.clone();
+        let runtime = self.runtime;
         py.detach(move || {
             runtime.block_on(async move {
-                let client = inner.lock().unwrap();
+                let client = inner.read().unwrap();
                 client.send_direct_message(&content).await
             })
         })
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
     }
 
-    pub fn setup_direct_messaging(&self, recipient_npub: String) -> PyResult<()> {
+    pub fn setup_direct_messaging(&self, py: Python<'_>, recipient_npub: String) -> PyResult<()> {
         use nostr::prelude::*;
-        use nostr_sdk::prelude::*;
-        use sentrystr::{DirectMessageBuilder, Level};
+        use sentrystr::Level;
         use std::str::FromStr;
 
-        self.runtime.block_on(async {
-            // Parse the recipient public key
-            let recipient_pubkey = PublicKey::from_str(&recipient_npub).map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid pubkey: {}", e))
-            })?;
-
-            // Generate keys for the DM client
-            let keys = Keys::generate();
-            let nostr_client = Client::new(keys.clone());
+        // Parse the recipient public key
+        let recipient_pubkey = PublicKey::from_str(&recipient_npub).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid pubkey: {}", e))
+        })?;
 
-            // Add the same relays as the main client (simplified approach)
-            nostr_client
-                .add_relay("wss://relay.damus.io")
-                .await
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-            nostr_client
-                .add_relay("wss://nos.lol")
-                .await
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-            nostr_client
-                .add_relay("wss://nostr.chaima.info")
-                .await
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-            nostr_client.connect().await;
-
-            // Build the DirectMessageSender
-            let dm_sender = DirectMessageBuilder::new()
-                .with_client(nostr_client)
-                .with_keys(keys)
-                .with_recipient(recipient_pubkey)
-                .with_min_level(Level::Warning) // Only send DMs for warnings and above
-                .with_nip17(true) // Use NIP-17 for better privacy
-                .build()
-                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        // Send DMs over the main client's relay connections instead of opening
+        // a second pool; they are still signed with their own generated keys.
+        let dm_sender = DirectMessageBuilder::new()
+            .with_client(self.relay_client.clone())
+            .with_keys(Keys::generate())
+            .with_recipient(recipient_pubkey)
+            .with_min_level(Level::Warning) // Only send DMs for warnings and above
+            .with_nip17(true) // Use NIP-17 for better privacy
+            .build()
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
-            // Set up direct messaging on the client
-            let mut client = self.inner.lock().unwrap();
-            client.set_direct_messaging(dm_sender);
+        // Captures hold the read lock for their whole publish, so waiting for
+        // the write lock can take a while; do it without the GIL.
+        let inner = self.inner.clone();
+        py.detach(move || inner.write().unwrap().set_direct_messaging(dm_sender));
 
-            Ok(())
-        })
+        Ok(())
     }
 
     fn __repr__(&self) -> String {
-        "NostrSentryClient()".to_string()
+        format!("NostrSentryClient(public_key={})", self.public_key.to_hex())
     }
 }
@@ -1,3 +1,4 @@
+use nostr::PublicKey;
 use pyo3::prelude::*;
 use sentrystr::{Config, EncryptionVersion};
 
@@ -55,15 +56,65 @@ impl PyConfig {
         self.inner.event_kind = event_kind;
     }
 
-    pub fn with_encryption(&mut self, recipient_pubkey: String) {
-        self.inner = self.inner.clone().with_encryption(recipient_pubkey);
+    pub fn with_encryption<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        recipient_pubkey: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner = slf.inner.clone().with_encryption(recipient_pubkey);
+        slf
     }
 
-    pub fn with_nip44_encryption(&mut self, recipient_pubkey: String) {
-        self.inner = self.inner.clone().with_nip44_encryption(recipient_pubkey);
+    pub fn with_nip44_encryption<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        recipient_pubkey: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner = slf.inner.clone().with_nip44_encryption(recipient_pubkey);
+        slf
     }
 
-    pub fn with_encryption_version(&mut self, version: String) -> PyResult<()> {
+    /// Like `with_encryption`, but takes the recipient's raw 32-byte public key
+    /// (e.g. another client's `public_key_bytes`) and validates it immediately
+    /// rather than when the client is created.
+    pub fn with_encryption_bytes<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        recipient_pubkey: &[u8],
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        let pubkey = PublicKey::from_slice(recipient_pubkey).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid public key: {}", e))
+        })?;
+        slf.inner = slf.inner.clone().with_encryption(pubkey.to_hex());
+        Ok(slf)
+    }
+
+    /// Returns a copy of this config with NIP-44 encryption to
+    /// `recipient_pubkey` enabled, leaving `self` unchanged, so one base config
+    /// can back both a public and an encrypted client.
+    pub fn clone_with_encryption(&self, recipient_pubkey: String) -> Self {
+        Self {
+            inner: self.inner.clone().with_encryption(recipient_pubkey),
+        }
+    }
+
+    /// Pace publishing to at most `events_per_sec`; captures beyond the rate
+    /// wait their turn (with the GIL released) instead of all hitting the
+    /// relays at once.
+    pub fn with_rate_limit<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        events_per_sec: f64,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        if !(events_per_sec.is_finite() && events_per_sec > 0.0) {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Rate limit must be a positive number of events per second",
+            ));
+        }
+        slf.inner = slf.inner.clone().with_rate_limit(events_per_sec);
+        Ok(slf)
+    }
+
+    pub fn with_encryption_version<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        version: String,
+    ) -> PyResult<PyRefMut<'py, Self>> {
         let encryption_version = match version.as_str() {
             "none" => EncryptionVersion::None,
             "nip44v2" => EncryptionVersion::Nip44V2,
@@ -73,8 +124,8 @@ impl PyConfig {
                 ));
             }
         };
-        self.inner.encryption_version = encryption_version;
-        Ok(())
+        slf.inner.encryption_version = encryption_version;
+        Ok(slf)
     }
 
     fn __repr__(&self) -> String {
@@ -3,13 +3,17 @@
 // value here.
 #![allow(clippy::new_without_default)]
 
+use chrono::{DateTime, Utc};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString};
 use sentrystr::{Event, Exception, Frame, Level, Request, Stacktrace, User};
 use std::collections::HashMap;
+use uuid::Uuid;
 
-#[pyclass(name = "Level")]
-#[derive(Debug, Clone)]
+// Levels and stacktraces are never mutated after construction, so they are
+// frozen: PyO3 can hand out shared references without runtime borrow checks.
+#[pyclass(name = "Level", eq, ord, hash, frozen)]
+#[derive(Debug, Clone, PartialEq, PartialOrd, Hash)]
 pub enum PyLevel {
     Debug,
     Info,
@@ -35,13 +39,7 @@ impl PyLevel {
     }
 
     fn __str__(&self) -> &'static str {
-        match self {
-            PyLevel::Debug => "debug",
-            PyLevel::Info => "info",
-            PyLevel::Warning => "warning",
-            PyLevel::Error => "error",
-            PyLevel::Fatal => "fatal",
-        }
+        Level::from(self.clone()).as_str()
     }
 
     fn __repr__(&self) -> String {
@@ -84,19 +82,7 @@ impl PyFrame {
     #[new]
     pub fn new(filename: String) -> Self {
         Self {
-            inner: Frame {
-                filename,
-                function: None,
-                module: None,
-                lineno: None,
-                colno: None,
-                abs_path: None,
-                context_line: None,
-                pre_context: None,
-                post_context: None,
-                in_app: None,
-                vars: None,
-            },
+            inner: bare_frame(filename),
         }
     }
 
@@ -140,16 +126,38 @@ impl PyFrame {
         self.inner.colno = colno;
     }
 
-    pub fn with_function(&mut self, function: String) {
-        self.inner.function = Some(function);
+    pub fn with_function<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        function: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.function = Some(function);
+        slf
     }
 
-    pub fn with_lineno(&mut self, lineno: u32) {
-        self.inner.lineno = Some(lineno);
+    pub fn with_lineno<'py>(mut slf: PyRefMut<'py, Self>, lineno: u32) -> PyRefMut<'py, Self> {
+        slf.inner.lineno = Some(lineno);
+        slf
     }
 
-    pub fn with_colno(&mut self, colno: u32) {
-        self.inner.colno = Some(colno);
+    pub fn with_colno<'py>(mut slf: PyRefMut<'py, Self>, colno: u32) -> PyRefMut<'py, Self> {
+        slf.inner.colno = Some(colno);
+        slf
+    }
+}
+
+fn bare_frame(filename: String) -> Frame {
+    Frame {
+        filename,
+        function: None,
+        module: None,
+        lineno: None,
+        colno: None,
+        abs_path: None,
+        context_line: None,
+        pre_context: None,
+        post_context: None,
+        in_app: None,
+        vars: None,
     }
 }
 
@@ -159,7 +167,7 @@ impl From<PyFrame> for Frame {
     }
 }
 
-#[pyclass(name = "Stacktrace")]
+#[pyclass(name = "Stacktrace", frozen)]
 #[derive(Debug, Clone)]
 pub struct PyStacktrace {
     inner: Stacktrace,
@@ -175,6 +183,23 @@ impl PyStacktrace {
         }
     }
 
+    /// Build a stacktrace from `(filename, function, lineno)` tuples in one
+    /// call, instead of creating and configuring a `Frame` object per entry.
+    #[staticmethod]
+    pub fn from_frames(frames: Vec<(String, String, u32)>) -> Self {
+        let frames = frames
+            .into_iter()
+            .map(|(filename, function, lineno)| Frame {
+                function: Some(function),
+                lineno: Some(lineno),
+                ..bare_frame(filename)
+            })
+            .collect();
+        Self {
+            inner: Stacktrace { frames },
+        }
+    }
+
     #[getter]
     pub fn frames(&self) -> Vec<PyFrame> {
         self.inner
@@ -231,12 +256,17 @@ impl PyException {
         self.inner.module = module;
     }
 
-    pub fn with_module(&mut self, module: String) {
-        self.inner.module = Some(module);
+    pub fn with_module<'py>(mut slf: PyRefMut<'py, Self>, module: String) -> PyRefMut<'py, Self> {
+        slf.inner.module = Some(module);
+        slf
     }
 
-    pub fn with_stacktrace(&mut self, stacktrace: &PyStacktrace) {
-        self.inner.stacktrace = Some(stacktrace.inner.clone());
+    pub fn with_stacktrace<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        stacktrace: &PyStacktrace,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.stacktrace = Some(stacktrace.inner.clone());
+        slf
     }
 }
 
@@ -254,14 +284,22 @@ pub struct PyUser {
 
 #[pymethods]
 impl PyUser {
+    /// All fields are optional keywords, so a fully populated user is built in
+    /// one call, e.g. `User(id="42", email="a@b.c", username="alice")`.
     #[new]
-    pub fn new() -> Self {
+    #[pyo3(signature = (*, id=None, username=None, email=None, ip_address=None))]
+    pub fn new(
+        id: Option<String>,
+        username: Option<String>,
+        email: Option<String>,
+        ip_address: Option<String>,
+    ) -> Self {
         Self {
             inner: User {
-                id: None,
-                username: None,
-                email: None,
-                ip_address: None,
+                id,
+                username,
+                email,
+                ip_address,
             },
         }
     }
@@ -296,16 +334,22 @@ impl PyUser {
         self.inner.username = username;
     }
 
-    pub fn with_id(&mut self, id: String) {
-        self.inner.id = Some(id);
+    pub fn with_id<'py>(mut slf: PyRefMut<'py, Self>, id: String) -> PyRefMut<'py, Self> {
+        slf.inner.id = Some(id);
+        slf
     }
 
-    pub fn with_email(&mut self, email: String) {
-        self.inner.email = Some(email);
+    pub fn with_email<'py>(mut slf: PyRefMut<'py, Self>, email: String) -> PyRefMut<'py, Self> {
+        slf.inner.email = Some(email);
+        slf
     }
 
-    pub fn with_username(&mut self, username: String) {
-        self.inner.username = Some(username);
+    pub fn with_username<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        username: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.username = Some(username);
+        slf
     }
 }
 
@@ -368,16 +412,22 @@ impl PyRequest {
         self.inner.query_string = query_string;
     }
 
-    pub fn with_url(&mut self, url: String) {
-        self.inner.url = Some(url);
+    pub fn with_url<'py>(mut slf: PyRefMut<'py, Self>, url: String) -> PyRefMut<'py, Self> {
+        slf.inner.url = Some(url);
+        slf
     }
 
-    pub fn with_method(&mut self, method: String) {
-        self.inner.method = Some(method);
+    pub fn with_method<'py>(mut slf: PyRefMut<'py, Self>, method: String) -> PyRefMut<'py, Self> {
+        slf.inner.method = Some(method);
+        slf
     }
 
-    pub fn with_query_string(&mut self, query_string: String) {
-        self.inner.query_string = Some(query_string);
+    pub fn with_query_string<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        query_string: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.query_string = Some(query_string);
+        slf
     }
 }
 
@@ -402,11 +452,157 @@ impl PyEvent {
         }
     }
 
+    /// Build an error event for an exception in one call: the message, the
+    /// error level, the exception (with its stacktrace, if given), and any
+    /// tags and extras.
+    #[staticmethod]
+    #[pyo3(signature = (exception_type, message, stacktrace=None, tags=None, extras=None))]
+    pub fn from_exception(
+        exception_type: String,
+        message: String,
+        stacktrace: Option<PyRef<'_, PyStacktrace>>,
+        tags: Option<HashMap<String, String>>,
+        extras: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Self> {
+        let exception = Exception {
+            exception_type,
+            value: message.clone(),
+            module: None,
+            stacktrace: stacktrace.map(|st| st.inner.clone()),
+        };
+        let mut event = Self {
+            inner: Event::with_platform("python")
+                .with_message(message)
+                .with_level(Level::Error)
+                .with_exception(exception),
+        };
+        if let Some(tags) = tags {
+            event.inner.tags.extend(tags);
+        }
+        if let Some(extras) = extras {
+            event.add_extras(extras)?;
+        }
+        Ok(event)
+    }
+
+    /// Build an event from one dict in a single call, e.g.
+    /// `{"message": ..., "level": "error", "tags": {...}, "extra": {...}}`.
+    ///
+    /// Recognised keys are `message`, `logger`, `level` (a `Level` or its
+    /// name), `tags` (`dict[str, str]`), `extra` (dict), `user` (dict with
+    /// any of `id`, `username`, `email`, `ip_address`) and `exception` (a
+    /// `Exception`, or a dict with `type`, `value` and optional `module` and
+    /// `stacktrace`, the latter a `Stacktrace` or `(filename, function,
+    /// lineno)` tuples). Unknown keys raise `ValueError`.
+    #[staticmethod]
+    pub fn from_dict(data: &Bound<'_, PyDict>) -> PyResult<Self> {
+        let mut event = Self::new();
+        for (key, value) in data.iter() {
+            let key = key.downcast::<PyString>()?.to_cow()?;
+            match key.as_ref() {
+                "message" => event.inner.message = value.extract()?,
+                "logger" => event.inner.logger = value.extract()?,
+                "level" => {
+                    let level = match value.extract::<PyLevel>() {
+                        Ok(level) => level,
+                        Err(_) => PyLevel::new(&value.downcast::<PyString>()?.to_cow()?)?,
+                    };
+                    event.inner.level = level.into();
+                }
+                "tags" => event
+                    .inner
+                    .tags
+                    .extend(value.extract::<HashMap<String, String>>()?),
+                "extra" => event.add_extras(value.downcast::<PyDict>()?)?,
+                "user" => {
+                    let user = value.downcast::<PyDict>()?;
+                    check_keys(user, "user", &["id", "username", "email", "ip_address"])?;
+                    let field = |name: &str| -> PyResult<Option<String>> {
+                        match user.get_item(name)? {
+                            Some(v) => v.extract(),
+                            None => Ok(None),
+                        }
+                    };
+                    event.inner.user = Some(User {
+                        id: field("id")?,
+                        username: field("username")?,
+                        email: field("email")?,
+                        ip_address: field("ip_address")?,
+                    });
+                }
+                "exception" => {
+                    let exception = match value.extract::<PyRef<'_, PyException>>() {
+                        Ok(exception) => exception.inner.clone(),
+                        Err(_) => {
+                            let exception = value.downcast::<PyDict>()?;
+                            check_keys(
+                                exception,
+                                "exception",
+                                &["type", "value", "module", "stacktrace"],
+                            )?;
+                            let required = |name: &str| -> PyResult<String> {
+                                exception
+                                    .get_item(name)?
+                                    .ok_or_else(|| {
+                                        PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!(
+                                            "exception.{}",
+                                            name
+                                        ))
+                                    })?
+                                    .extract()
+                            };
+                            Exception {
+                                exception_type: required("type")?,
+                                value: required("value")?,
+                                module: match exception.get_item("module")? {
+                                    Some(v) => v.extract()?,
+                                    None => None,
+                                },
+                                stacktrace: match exception.get_item("stacktrace")? {
+                                    Some(v) => match v.extract::<PyRef<'_, PyStacktrace>>() {
+                                        Ok(stacktrace) => Some(stacktrace.inner.clone()),
+                                        Err(_) => {
+                                            Some(PyStacktrace::from_frames(v.extract()?).inner)
+                                        }
+                                    },
+                                    None => None,
+                                },
+                            }
+                        }
+                    };
+                    push_exception(&mut event.inner, exception);
+                }
+                other => {
+                    return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                        "Unknown event field: {}",
+                        other
+                    )));
+                }
+            }
+        }
+        Ok(event)
+    }
+
+    /// Return a copy of this event with a fresh `event_id` and timestamp, so a
+    /// template carrying shared fields can be stamped out per capture.
+    #[pyo3(name = "clone")]
+    pub fn clone_event(&self) -> Self {
+        let mut inner = self.inner.clone();
+        inner.event_id = Uuid::new_v4().to_string();
+        inner.timestamp = Utc::now();
+        Self { inner }
+    }
+
     #[getter]
     pub fn event_id(&self) -> String {
         self.inner.event_id.clone()
     }
 
+    #[getter]
+    pub fn timestamp(&self) -> DateTime<Utc> {
+        self.inner.timestamp
+    }
+
     #[getter]
     pub fn level(&self) -> PyLevel {
         self.inner.level.clone().into()
@@ -447,30 +643,62 @@ impl PyEvent {
         self.inner.platform = platform;
     }
 
-    pub fn with_message(&mut self, message: String) {
-        self.inner = self.inner.clone().with_message(message);
+    pub fn with_message<'py>(mut slf: PyRefMut<'py, Self>, message: String) -> PyRefMut<'py, Self> {
+        slf.inner.message = Some(message);
+        slf
+    }
+
+    pub fn with_level<'py>(mut slf: PyRefMut<'py, Self>, level: PyLevel) -> PyRefMut<'py, Self> {
+        slf.inner.level = level.into();
+        slf
     }
 
-    pub fn with_level(&mut self, level: PyLevel) {
-        self.inner = self.inner.clone().with_level(level.into());
+    pub fn with_user<'py>(mut slf: PyRefMut<'py, Self>, user: &PyUser) -> PyRefMut<'py, Self> {
+        slf.inner.user = Some(user.inner.clone());
+        slf
     }
 
-    pub fn with_user(&mut self, user: &PyUser) {
-        self.inner = self.inner.clone().with_user(user.inner.clone());
+    pub fn with_exception<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        exception: &PyException,
+    ) -> PyRefMut<'py, Self> {
+        push_exception(&mut slf.inner, exception.inner.clone());
+        slf
     }
 
-    pub fn with_exception(&mut self, exception: &PyException) {
-        self.inner = self.inner.clone().with_exception(exception.inner.clone());
+    /// Re-stamp the event with the current time, e.g. when a pre-built event
+    /// is captured later than it was created.
+    pub fn with_timestamp_now<'py>(mut slf: PyRefMut<'py, Self>) -> PyRefMut<'py, Self> {
+        slf.inner.timestamp = Utc::now();
+        slf
     }
 
-    pub fn with_tag(&mut self, key: String, value: String) {
-        self.inner = self.inner.clone().with_tag(key, value);
+    pub fn with_tag<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        key: String,
+        value: String,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.tags.insert(key, value);
+        slf
     }
 
-    pub fn with_extra(&mut self, key: String, value: &Bound<'_, PyAny>) -> PyResult<()> {
+    pub fn with_extra<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        key: String,
+        value: &Bound<'_, PyAny>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
         let json_value = python_to_json_value(value)?;
-        self.inner = self.inner.clone().with_extra(key, json_value);
-        Ok(())
+        slf.inner.extra.insert(key, json_value);
+        Ok(slf)
+    }
+
+    /// Add every entry of a `dict[str, str]` as a tag in one call.
+    pub fn with_tags<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        tags: HashMap<String, String>,
+    ) -> PyRefMut<'py, Self> {
+        slf.inner.tags.extend(tags);
+        slf
     }
 
     pub fn add_tag(&mut self, key: String, value: String) {
@@ -483,6 +711,32 @@ impl PyEvent {
         Ok(())
     }
 
+    /// Add an extra from already-serialised JSON, as `str` or `bytes` (e.g. the
+    /// output of `orjson.dumps`), skipping the object-by-object conversion of
+    /// large dict or list values.
+    pub fn add_extra_json(&mut self, key: String, json: &Bound<'_, PyAny>) -> PyResult<()> {
+        let parsed = if let Ok(bytes) = json.downcast::<PyBytes>() {
+            serde_json::from_slice(bytes.as_bytes())
+        } else {
+            serde_json::from_str(&json.downcast::<PyString>()?.to_cow()?)
+        };
+        let json_value = parsed.map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid JSON: {}", e))
+        })?;
+        self.inner.extra.insert(key, json_value);
+        Ok(())
+    }
+
+    /// Add every entry of a dict as extra data in one call.
+    pub fn add_extras(&mut self, extras: &Bound<'_, PyDict>) -> PyResult<()> {
+        self.inner.extra.reserve(extras.len());
+        for (key, value) in extras.iter() {
+            let key = key.extract::<String>()?;
+            self.inner.extra.insert(key, python_to_json_value(&value)?);
+        }
+        Ok(())
+    }
+
     #[getter]
     pub fn tags(&self) -> HashMap<String, String> {
         self.inner.tags.clone()
@@ -509,7 +763,54 @@ impl PyEvent {
     }
 }
 
+// The builder methods update the event in place. Going through the core
+// `Event::with_*` builders would mean cloning the whole event, every tag and
+// extra included, just to set one field.
+fn push_exception(event: &mut Event, exception: Exception) {
+    match event.exception {
+        Some(ref mut exceptions) => exceptions.push(exception),
+        None => event.exception = Some(vec![exception]),
+    }
+}
+
+/// Reject keys of a nested `from_dict` field that would otherwise be ignored.
+fn check_keys(dict: &Bound<'_, PyDict>, field: &str, allowed: &[&str]) -> PyResult<()> {
+    for key in dict.keys() {
+        let key = key.downcast::<PyString>()?.to_cow()?;
+        if !allowed.contains(&key.as_ref()) {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Unknown event field: {}.{}",
+                field, key
+            )));
+        }
+    }
+    Ok(())
+}
+
 fn python_to_json_value(value: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
+    use pyo3::types::{PyBool, PyFloat, PyInt};
+
+    // Exact-type checks for the common scalars first. A failed `extract`
+    // builds a `PyErr`, so probing bool, int, float and str in turn made every
+    // string extra pay for three discarded exceptions. Subclasses and other
+    // objects still go through the general conversion below.
+    if let Ok(s) = value.downcast_exact::<PyString>() {
+        return Ok(serde_json::Value::String(s.to_cow()?.into_owned()));
+    }
+    if let Ok(b) = value.downcast_exact::<PyBool>() {
+        return Ok(serde_json::Value::Bool(b.is_true()));
+    }
+    if value.downcast_exact::<PyInt>().is_ok()
+        && let Ok(i) = value.extract::<i64>()
+    {
+        return Ok(serde_json::Value::Number(serde_json::Number::from(i)));
+    }
+    if let Ok(f) = value.downcast_exact::<PyFloat>() {
+        return Ok(serde_json::Value::Number(
+            serde_json::Number::from_f64(f.value()).unwrap_or(serde_json::Number::from(0)),
+        ));
+    }
+
     if value.is_none() {
         Ok(serde_json::Value::Null)
     } else if let Ok(b) = value.extract::<bool>() {
@@ -543,7 +844,7 @@ fn python_to_json_value(value: &Bound<'_, PyAny>) -> PyResult<serde_json::Value>
 }
 
 fn json_value_to_python(py: Python, value: &serde_json::Value) -> PyResult<Py<PyAny>> {
-    use pyo3::types::{PyBool, PyFloat, PyInt, PyString};
+    use pyo3::types::{PyBool, PyFloat, PyInt};
 
     match value {
         serde_json::Value::Null => Ok(py.None()),
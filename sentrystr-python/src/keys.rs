@@ -0,0 +1,42 @@
+use nostr::prelude::{FromBech32, Keys, PublicKey, ToBech32};
+use pyo3::prelude::*;
+
+/// Generate a new secp256k1 keypair, returned as `(secret_key_hex, public_key_hex)`.
+///
+/// The secret key is sampled by libsecp256k1, so it is always a valid scalar,
+/// and the public key is the real x-only key derived from it.
+#[pyfunction]
+pub fn generate_keypair() -> (String, String) {
+    let keys = Keys::generate();
+    (
+        keys.secret_key().display_secret().to_string(),
+        keys.public_key().to_hex(),
+    )
+}
+
+/// Generate `count` keypairs in one call, each as `(secret_key_hex, public_key_hex)`.
+#[pyfunction]
+pub fn generate_keypairs(count: usize) -> Vec<(String, String)> {
+    (0..count).map(|_| generate_keypair()).collect()
+}
+
+/// Decode a bech32 `npub1...` public key into its 64-character hex form.
+#[pyfunction]
+pub fn npub_to_hex(npub: &str) -> PyResult<String> {
+    PublicKey::from_bech32(npub)
+        .map(|pubkey| pubkey.to_hex())
+        .map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid npub: {}", e))
+        })
+}
+
+/// Encode a 64-character hex public key as a bech32 `npub1...` string.
+#[pyfunction]
+pub fn hex_to_npub(hex_key: &str) -> PyResult<String> {
+    let pubkey = PublicKey::from_hex(hex_key).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid public key: {}", e))
+    })?;
+    pubkey
+        .to_bech32()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+}
@@ -4,11 +4,13 @@ mod client;
 mod config;
 mod error;
 mod event;
+mod keys;
 
 pub use client::*;
 pub use config::*;
 pub use error::*;
 pub use event::*;
+pub use keys::*;
 
 #[pymodule]
 fn _sentrystr(m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -22,6 +24,10 @@ fn _sentrystr(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyUser>()?;
     m.add_class::<PyRequest>()?;
     m.add_class::<PySentryStrError>()?;
+    m.add_function(wrap_pyfunction!(generate_keypair, m)?)?;
+    m.add_function(wrap_pyfunction!(generate_keypairs, m)?)?;
+    m.add_function(wrap_pyfunction!(npub_to_hex, m)?)?;
+    m.add_function(wrap_pyfunction!(hex_to_npub, m)?)?;
 
     Ok(())
 }
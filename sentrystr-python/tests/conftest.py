@@ -0,0 +1,18 @@
+# The tests import the installed `sentrystr` package; build and install it
+# into the active environment with `maturin develop` (or `make dev`) first.
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """One client for the whole session, so its relays are connected once.
+
+    Tests must not reconfigure it (e.g. ``setup_direct_messaging``); a test
+    that needs a differently configured client builds its own.
+    """
+    from key_generator import get_cached_test_keys
+    from sentrystr import Config, NostrSentryClient
+    from test_config import TEST_RELAYS
+
+    config = Config(get_cached_test_keys()["private_key"], TEST_RELAYS)
+    return NostrSentryClient(config)
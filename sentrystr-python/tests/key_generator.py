@@ -1,30 +1,81 @@
 #!/usr/bin/env python3
 
-import hashlib
-import secrets
+import json
+import os
+import string
+import tempfile
+from functools import lru_cache
 
+import sentrystr
 
-def generate_test_keys():
-    while True:
-        private_key_bytes = secrets.token_bytes(32)
-        if private_key_bytes != b"\x00" * 32:
-            break
+# Opt-in: when set, generate_test_keys reuses the keypair stored at this path
+# across runs instead of generating a new one every time.
+KEY_CACHE_ENV = "SENTRYSTR_TEST_KEY_CACHE"
+
+
+def _is_hex_key(value):
+    return (
+        isinstance(value, str)
+        and len(value) == 64
+        and all(c in string.hexdigits for c in value)
+    )
 
-    private_key_hex = private_key_bytes.hex()
 
-    return {
+def generate_test_keys():
+    cache_path = os.environ.get(KEY_CACHE_ENV)
+    if cache_path:
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+        # A stale or foreign file is regenerated rather than trusted.
+        if (
+            isinstance(cached, dict)
+            and all(
+                _is_hex_key(cached.get(field))
+                for field in ("private_key", "private_key_hex", "public_key_hex")
+            )
+            and cached["private_key"] == cached["private_key_hex"]
+        ):
+            return cached
+
+    private_key_hex, public_key_hex = sentrystr.generate_keypair()
+    keys = {
         "private_key": private_key_hex,
         "private_key_hex": private_key_hex,
-        "public_key_hex": hashlib.sha256(private_key_bytes).hexdigest(),
+        "public_key_hex": public_key_hex,
     }
 
+    if cache_path:
+        # Write to a private temp file and rename it into place, so a
+        # concurrent run never reads a half-written cache.
+        cache_dir = os.path.dirname(os.path.abspath(cache_path))
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(keys, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    return keys
+
+
+@lru_cache(maxsize=1)
+def get_cached_test_keys():
+    """One keypair per process, for tests that only need *a* sender identity."""
+    return generate_test_keys()
+
 
 def get_target_pubkey():
     return "npub18kpn83drge7x9vz4cuhh7xta79sl4tfq55se4e554yj90s8y3f7qa49nps"
 
 
+@lru_cache(maxsize=None)
 def get_target_pubkey_hex():
-    return "3f20a2dd93cd83c89b45ad1c77d4d7f26f4f2e54a5b5249249f30ecc924b1ad9"
+    return sentrystr.npub_to_hex(get_target_pubkey())
 
 
 if __name__ == "__main__":
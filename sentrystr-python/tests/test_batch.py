@@ -0,0 +1,60 @@
+import gc
+import threading
+
+import pytest
+from sentrystr import bulk_capture
+
+
+class RecordingClient:
+    def __init__(self):
+        self.batches = []
+
+    def capture_events(self, events):
+        self.batches.append(list(events))
+
+
+def test_events_are_captured_together_on_exit():
+    client = RecordingClient()
+    with bulk_capture(client) as batch:
+        batch.add("first")
+        batch.add("second")
+        assert client.batches == []
+    assert client.batches == [["first", "second"]]
+
+
+def test_events_are_dropped_when_the_block_raises():
+    client = RecordingClient()
+    with pytest.raises(RuntimeError), bulk_capture(client) as batch:
+        batch.add("lost")
+        raise RuntimeError("boom")
+    assert client.batches == []
+
+
+def test_empty_block_sends_nothing():
+    client = RecordingClient()
+    with bulk_capture(client):
+        pass
+    assert client.batches == []
+
+
+def test_overlapping_blocks_keep_gc_paused_until_the_last_exits():
+    assert gc.isenabled()
+    client = RecordingClient()
+    inside = threading.Event()
+    release = threading.Event()
+
+    def other_thread():
+        with bulk_capture(client):
+            inside.set()
+            release.wait()
+
+    worker = threading.Thread(target=other_thread)
+    worker.start()
+    inside.wait()
+    with bulk_capture(client):
+        assert not gc.isenabled()
+    # The other thread's block is still open.
+    assert not gc.isenabled()
+    release.set()
+    worker.join()
+    assert gc.isenabled()
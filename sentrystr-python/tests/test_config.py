@@ -1,7 +1,13 @@
+import os
+
 TARGET_NPUB = "npub18kpn83drge7x9vz4cuhh7xta79sl4tfq55se4e554yj90s8y3f7qa49nps"
 TEST_PRIVATE_KEY = "nsec1j4c6269y9w0q2er2xjw8sv2ehyrtfxq3jwgdlxj6qfn8z4gjsq5qfvfk99"
-TEST_RELAYS = [
-    "wss://relay.damus.io",
-    "wss://nos.lol",
-    "wss://nostr.chaima.info"
+
+# One relay is enough to exercise the bindings, and every extra relay is
+# another TLS handshake per client. Set SENTRYSTR_TEST_EXTRA_RELAYS to a
+# comma-separated list to also publish to more relays, e.g. in CI.
+TEST_RELAYS = ["wss://relay.damus.io"] + [
+    relay.strip()
+    for relay in os.environ.get("SENTRYSTR_TEST_EXTRA_RELAYS", "").split(",")
+    if relay.strip()
 ]
@@ -0,0 +1,40 @@
+import pytest
+from sentrystr import Event, Level
+
+
+def test_from_dict_builds_full_event():
+    event = Event.from_dict(
+        {
+            "message": "Payment failed",
+            "logger": "billing",
+            "level": "error",
+            "tags": {"component": "billing"},
+            "extra": {"order_id": 1234},
+            "user": {"id": "user123", "email": "user@example.com"},
+            "exception": {
+                "type": "ValueError",
+                "value": "bad amount",
+                "module": "billing.charge",
+                "stacktrace": [("billing/charge.py", "charge", 42)],
+            },
+        }
+    )
+
+    assert event.message == "Payment failed"
+    assert event.logger == "billing"
+    assert event.level == Level("error")
+    assert event.tags == {"component": "billing"}
+    assert event.extra == {"order_id": 1234}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"mesage": "typo"},
+        {"user": {"id": "user123", "name": "john"}},
+        {"exception": {"type": "ValueError", "value": "bad", "trace": []}},
+    ],
+)
+def test_from_dict_rejects_unknown_keys(data):
+    with pytest.raises(ValueError):
+        Event.from_dict(data)
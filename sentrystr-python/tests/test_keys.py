@@ -0,0 +1,29 @@
+import pytest
+from sentrystr import hex_to_npub, npub_to_hex
+from test_config import TARGET_NPUB
+
+TARGET_HEX = "3d8333c5a3467c62b055c72f7f197df161faad20a5219ae694a92457c0e48a7c"
+
+
+def test_npub_to_hex_decodes_target():
+    assert npub_to_hex(TARGET_NPUB) == TARGET_HEX
+
+
+def test_hex_to_npub_round_trips():
+    assert hex_to_npub(TARGET_HEX) == TARGET_NPUB
+    assert npub_to_hex(hex_to_npub(TARGET_HEX)) == TARGET_HEX
+
+
+@pytest.mark.parametrize(
+    "npub",
+    ["", "npub1invalid", TARGET_NPUB[:-1] + "q", TARGET_HEX],
+)
+def test_npub_to_hex_rejects_malformed_input(npub):
+    with pytest.raises(ValueError):
+        npub_to_hex(npub)
+
+
+@pytest.mark.parametrize("hex_key", ["", "zz" * 32, TARGET_HEX[:-2], TARGET_NPUB])
+def test_hex_to_npub_rejects_malformed_input(hex_key):
+    with pytest.raises(ValueError):
+        hex_to_npub(hex_key)
@@ -1,55 +1,66 @@
 #!/usr/bin/env python3
 
-import os
+import asyncio
 import sys
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+from key_generator import get_cached_test_keys
+from sentrystr import (
+    Config,
+    Event,
+    Level,
+    NostrSentryClient,
+    capture_events_async,
+    send_direct_message_async,
+)
+from test_config import TARGET_NPUB, TEST_RELAYS
 
-try:
-    import sentrystr
-    from key_generator import generate_test_keys
-except ImportError as e:
-    print(f"❌ Failed to import: {e}")
-    sys.exit(1)
+LEVELS = {name: Level(name) for name in ("info", "warning", "error")}
 
-TARGET_NPUB = "npub18kpn83drge7x9vz4cuhh7xta79sl4tfq55se4e554yj90s8y3f7qa49nps"
-RELAYS = ["wss://relay.damus.io", "wss://nos.lol", "wss://nostr.chaima.info"]
 
+async def run_combined_example(shared_client=None):
+    config = Config(get_cached_test_keys()["private_key"], TEST_RELAYS)
+    if shared_client is None:
+        client = NostrSentryClient(config)
+    else:
+        # A derived client reuses the shared connections but keeps its own
+        # direct-messaging setup, so `shared_client` is left unconfigured.
+        client = NostrSentryClient.from_client(config, shared_client)
+    client.setup_direct_messaging(TARGET_NPUB)
 
-def run_combined_example():
-    keys = generate_test_keys()
-    sender_private_key = keys["private_key"]
+    info_event = (
+        Event()
+        .with_message("Application started")
+        .with_level(LEVELS["info"])
+    )
 
-    try:
-        config = sentrystr.Config(sender_private_key, RELAYS)
-        client = sentrystr.NostrSentryClient(config)
-        client.setup_direct_messaging(TARGET_NPUB)
+    warning_event = (
+        Event()
+        .with_message("High memory usage")
+        .with_level(LEVELS["warning"])
+    )
 
-        info_event = sentrystr.Event()
-        info_event.with_message("Application started")
-        info_event.with_level(sentrystr.Level("info"))
-        client.capture_event(info_event)
+    error_event = (
+        Event()
+        .with_message("hello from python")
+        .with_level(LEVELS["error"])
+    )
 
-        warning_event = sentrystr.Event()
-        warning_event.with_message("High memory usage")
-        warning_event.with_level(sentrystr.Level("warning"))
-        client.capture_event(warning_event)
+    # Each capture returns once the relays have acknowledged it, so the
+    # events and the direct message are published concurrently.
+    await asyncio.gather(
+        capture_events_async(client, [info_event, warning_event, error_event]),
+        send_direct_message_async(client, "System maintenance required"),
+    )
 
-        client.send_direct_message("System maintenance required")
 
-        error_event = sentrystr.Event()
-        error_event.with_message("hello from python")
-        error_event.with_level(sentrystr.Level("error"))
-        client.capture_event(error_event)
+def test_combined_example(shared_client):
+    asyncio.run(run_combined_example(shared_client))
 
-        print("✅ Combined example completed")
-        return True
 
+if __name__ == "__main__":
+    try:
+        asyncio.run(run_combined_example())
     except Exception as e:
         print(f"❌ Failed: {e}")
-        return False
-
-
-if __name__ == "__main__":
-    success = run_combined_example()
-    sys.exit(0 if success else 1)
+        sys.exit(1)
+    print("✅ Combined example completed")
@@ -63,9 +63,6 @@ async fn main() -> Result<()> {
         .await?;
     println!("📨 Sent standalone NIP-17 DM");
 
-    // Wait a bit for messages to propagate
-    tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
-
     // Test 2: NIP-44 messaging
     println!("\n🧪 Test 2: NIP-44 Direct Messaging");
     let dm_sender_nip44 = DirectMessageBuilder::new()
@@ -102,9 +99,6 @@ async fn main() -> Result<()> {
         .await?;
     println!("📨 Sent standalone NIP-44 DM");
 
-    // Wait for messages to propagate
-    tokio::time::sleep(tokio::time::Duration::from_secs(2)).await;
-
     // Test 3: Level filtering test
     println!("\n🧪 Test 3: Level Filtering");
     let dm_sender_warning = DirectMessageBuilder::new()
@@ -145,9 +139,6 @@ async fn main() -> Result<()> {
     client.capture_event(fatal_event).await?;
     println!("📨 Sent fatal event with DM");
 
-    // Wait for final messages
-    tokio::time::sleep(tokio::time::Duration::from_secs(3)).await;
-
     // Test 4: Disable and re-enable DMs
     println!("\n🧪 Test 4: Dynamic Configuration");
 
@@ -1,8 +1,11 @@
+use crate::rate_limit::RateLimiter;
 use crate::{
-    Config, DirectMessageSender, EncryptionVersion, Event, MessageEvent, Result, SentryStrError,
-    validate_encryption_keys,
+    Config, DirectMessageBuilder, DirectMessageSender, EncryptionHelper, EncryptionVersion, Event,
+    MessageEvent, Result, SentryStrError, validate_encryption_keys,
 };
 use chrono::Utc;
+use futures::future::join_all;
+use nostr::nips::nip44::v2::ConversationKey;
 use nostr::prelude::*;
 use nostr_sdk::prelude::*;
 
@@ -28,6 +31,11 @@ pub struct NostrSentryClient {
     client: Client,
     config: Config,
     keys: Keys,
+    // The NIP-44 conversation key depends only on our keys and the recipient,
+    // so the recipient is decoded, checked and run through ECDH once here
+    // rather than for every event.
+    conversation_key: Option<ConversationKey>,
+    rate_limiter: Option<RateLimiter>,
     dm_sender: Option<DirectMessageSender>,
 }
 
@@ -38,22 +46,81 @@ impl NostrSentryClient {
     pub async fn new(config: Config) -> Result<Self> {
         let keys = config.get_keys()?;
         let client = Client::new(keys.clone());
+        let sentry = Self::from_parts(config, keys, client)?;
 
-        for relay in &config.relays {
-            client.add_relay(relay).await?;
+        for relay in &sentry.config.relays {
+            sentry.client.add_relay(relay).await?;
         }
 
-        client.connect().await;
+        sentry.client.connect().await;
+
+        Ok(sentry)
+    }
+
+    /// Creates a NostrSentryClient that publishes over an existing nostr-sdk
+    /// [`Client`] (typically one already connected to `config.relays`) instead
+    /// of opening its own connections.
+    ///
+    /// Every event is signed with `config`'s keys before it is sent, so one
+    /// connection pool can carry several SentryStr identities. The shared
+    /// client's signer is still the one nostr-sdk uses for NIP-42 AUTH, so
+    /// relays that require the authenticated key to match the event author
+    /// will refuse other identities. Note that [`Self::disconnect`] closes
+    /// the shared connections for every user of `client`.
+    pub fn from_client(config: Config, client: Client) -> Result<Self> {
+        let keys = config.get_keys()?;
+        Self::from_parts(config, keys, client)
+    }
+
+    fn from_parts(config: Config, keys: Keys, client: Client) -> Result<Self> {
+        let recipient_pubkey = if config.encrypt_events {
+            config.get_recipient_pubkey()?
+        } else {
+            None
+        };
+        let conversation_key = match recipient_pubkey {
+            Some(ref recipient_pubkey) => {
+                validate_encryption_keys(&keys, recipient_pubkey)?;
+                Some(EncryptionHelper::conversation_key(
+                    keys.secret_key(),
+                    recipient_pubkey,
+                )?)
+            }
+            None => None,
+        };
+        let rate_limiter = match config.rate_limit {
+            Some(rate) if rate.is_finite() && rate > 0.0 => Some(RateLimiter::new(rate)),
+            Some(rate) => {
+                return Err(SentryStrError::Config(format!(
+                    "Rate limit must be a positive number of events per second, got {}",
+                    rate
+                )));
+            }
+            None => None,
+        };
 
         Ok(Self {
             client,
             config,
             keys,
+            conversation_key,
+            rate_limiter,
             dm_sender: None,
         })
     }
 
+    /// The underlying nostr-sdk client, e.g. to hand to [`Self::from_client`].
+    pub fn relay_client(&self) -> &Client {
+        &self.client
+    }
+
     pub async fn capture_event(&self, event: Event) -> Result<EventId> {
+        // Wait for a token before building the nostr event, so `created_at`
+        // reflects when it is actually sent rather than when it was queued.
+        if let Some(ref rate_limiter) = self.rate_limiter {
+            rate_limiter.acquire().await;
+        }
+
         let content = serde_json::to_string(&event)?;
 
         let nostr_event = if self.config.encrypt_events {
@@ -64,15 +131,9 @@ impl NostrSentryClient {
                     ));
                 }
                 EncryptionVersion::Nip44V2 => {
-                    if let Some(recipient_pubkey) = self.config.get_recipient_pubkey()? {
-                        validate_encryption_keys(&self.keys, &recipient_pubkey)?;
-
-                        let encrypted_content = nostr::nips::nip44::encrypt(
-                            self.keys.secret_key(),
-                            &recipient_pubkey,
-                            &content,
-                            nostr::nips::nip44::Version::V2,
-                        )?;
+                    if let Some(ref conversation_key) = self.conversation_key {
+                        let encrypted_content =
+                            EncryptionHelper::encrypt_nip44_with(conversation_key, &content)?;
 
                         let mut builder = EventBuilder::new(
                             Kind::Custom(self.config.event_kind),
@@ -109,12 +170,16 @@ impl NostrSentryClient {
             builder.sign_with_keys(&self.keys)?
         };
 
+        // Resolves once the relays have answered with their NIP-01 `OK`, so
+        // callers never need to sleep to let an event "propagate".
         let output = self.client.send_event(&nostr_event).await?;
 
         // Send direct message if configured
         if let Some(ref dm_sender) = self.dm_sender {
+            // `event` is not needed after this, so move it rather than
+            // deep-copying its tags and extras.
             let message_event = MessageEvent {
-                event: event.clone(),
+                event,
                 author: self.keys.public_key(),
                 nostr_event_id: output.val,
                 received_at: Utc::now(),
@@ -128,6 +193,17 @@ impl NostrSentryClient {
         Ok(output.val)
     }
 
+    /// Captures several events concurrently.
+    ///
+    /// Every event is signed and published exactly as [`capture_event`] would,
+    /// but the relay round-trips overlap instead of being awaited one after
+    /// another. Results are returned in the same order as `events`.
+    ///
+    /// [`capture_event`]: Self::capture_event
+    pub async fn capture_events(&self, events: Vec<Event>) -> Vec<Result<EventId>> {
+        join_all(events.into_iter().map(|event| self.capture_event(event))).await
+    }
+
     pub async fn capture_message(&self, message: impl Into<String>) -> Result<EventId> {
         let event = Event::new().with_message(message);
         self.capture_event(event).await
@@ -140,6 +216,26 @@ impl NostrSentryClient {
         self.capture_event(event).await
     }
 
+    /// Returns the public key events are published under.
+    pub fn public_key(&self) -> PublicKey {
+        self.keys.public_key()
+    }
+
+    /// URLs of the configured relays that currently have an open connection.
+    ///
+    /// Connections are dialled in the background by [`NostrSentryClient::new`]
+    /// and kept alive (with automatic reconnects) by the relay pool, so this is
+    /// a cheap way to check the pool is warm before publishing.
+    pub async fn connected_relays(&self) -> Vec<String> {
+        self.client
+            .relays()
+            .await
+            .into_iter()
+            .filter(|(_, relay)| relay.is_connected())
+            .map(|(url, _)| url.to_string())
+            .collect()
+    }
+
     pub async fn disconnect(&self) -> Result<()> {
         self.client.disconnect().await;
         Ok(())
@@ -152,6 +248,14 @@ impl NostrSentryClient {
         }
     }
 
+    /// Returns a [`DirectMessageBuilder`] that sends over this client's
+    /// already-connected relays, so enabling direct messages opens no new
+    /// connections. Keys, recipient and level filter are set on the builder
+    /// as usual; messages are signed with those keys, not this client's.
+    pub fn direct_message_builder(&self) -> DirectMessageBuilder {
+        DirectMessageBuilder::new().with_client(self.client.clone())
+    }
+
     pub fn with_direct_messaging(mut self, dm_sender: DirectMessageSender) -> Self {
         self.dm_sender = Some(dm_sender);
         self
@@ -10,6 +10,10 @@ pub struct Config {
     pub event_kind: u16,
     pub tags: Option<Vec<Tag>>,
     pub encryption_version: EncryptionVersion,
+    /// Maximum events per second published by `capture_event`; `None` means
+    /// unlimited.
+    #[serde(default)]
+    pub rate_limit: Option<f64>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -28,6 +32,7 @@ impl Config {
             event_kind: 9898,
             tags: None,
             encryption_version: EncryptionVersion::None,
+            rate_limit: None,
         }
     }
 
@@ -45,6 +50,13 @@ impl Config {
         self
     }
 
+    /// Paces `capture_event` to at most `events_per_sec`, queueing callers
+    /// instead of sending bursts that relays may reject as rate-limited.
+    pub fn with_rate_limit(mut self, events_per_sec: f64) -> Self {
+        self.rate_limit = Some(events_per_sec);
+        self
+    }
+
     pub fn with_tags(mut self, tags: Vec<Tag>) -> Self {
         self.tags = Some(tags);
         self
@@ -1,4 +1,8 @@
 use crate::{Result, SentryStrError};
+use base64::Engine;
+use base64::engine::general_purpose::STANDARD as BASE64;
+use nostr::nips::nip44;
+use nostr::nips::nip44::v2::ConversationKey;
 use nostr::prelude::*;
 
 pub struct EncryptionHelper;
@@ -18,6 +22,27 @@ impl EncryptionHelper {
         Ok(encrypted)
     }
 
+    /// Derives the NIP-44 v2 conversation key shared by a sender and
+    /// recipient. This is the ECDH step of [`Self::encrypt_nip44`]; it depends
+    /// only on the two keys, so callers encrypting many payloads to the same
+    /// recipient can derive it once and use [`Self::encrypt_nip44_with`].
+    pub fn conversation_key(
+        sender_secret_key: &SecretKey,
+        recipient_public_key: &PublicKey,
+    ) -> Result<ConversationKey> {
+        let key = ConversationKey::derive(sender_secret_key, recipient_public_key)
+            .map_err(nip44::Error::from)?;
+        Ok(key)
+    }
+
+    /// Encrypts `content` with a precomputed conversation key. The output is
+    /// identical in format to [`Self::encrypt_nip44`].
+    pub fn encrypt_nip44_with(conversation_key: &ConversationKey, content: &str) -> Result<String> {
+        let payload =
+            nip44::v2::encrypt_to_bytes(conversation_key, content).map_err(nip44::Error::from)?;
+        Ok(BASE64.encode(payload))
+    }
+
     pub fn decrypt_nip44(
         receiver_secret_key: &SecretKey,
         sender_public_key: &PublicKey,
@@ -45,3 +70,38 @@ pub fn validate_encryption_keys(sender_keys: &Keys, recipient_pubkey: &PublicKey
     }
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn round_trip(message: &str) {
+        let sender = Keys::generate();
+        let recipient = Keys::generate();
+
+        let conversation_key =
+            EncryptionHelper::conversation_key(sender.secret_key(), &recipient.public_key())
+                .unwrap();
+        let encrypted = EncryptionHelper::encrypt_nip44_with(&conversation_key, message).unwrap();
+
+        let decrypted = EncryptionHelper::decrypt_nip44(
+            recipient.secret_key(),
+            &sender.public_key(),
+            &encrypted,
+        )
+        .unwrap();
+        assert_eq!(decrypted, message);
+    }
+
+    #[test]
+    fn precomputed_key_output_decrypts_with_nip44() {
+        round_trip("hello from sentrystr");
+    }
+
+    #[test]
+    fn precomputed_key_output_decrypts_multi_kb_payload() {
+        let message = "{\"extra\":\"0123456789abcdef\"}".repeat(256);
+        assert!(message.len() > 4096);
+        round_trip(&message);
+    }
+}
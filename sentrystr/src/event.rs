@@ -4,30 +4,48 @@ use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use uuid::Uuid;
 
+// `None` fields are left out of the serialized payload rather than written as
+// `null`: most events set only a handful of them, and every byte left out is
+// one that is not encrypted, hashed for signing, or sent to each relay. Serde
+// reads a missing `Option` field back as `None`, so parsing is unaffected.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Event {
     pub event_id: String,
     pub timestamp: DateTime<Utc>,
     pub platform: String,
     pub level: Level,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub logger: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub transaction: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub server_name: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub release: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub environment: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub message: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub exception: Option<Vec<Exception>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub stacktrace: Option<Stacktrace>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub user: Option<User>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub request: Option<Request>,
     pub tags: HashMap<String, String>,
     pub extra: HashMap<String, serde_json::Value>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub fingerprint: Option<Vec<String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub modules: Option<HashMap<String, String>>,
     pub nostr_tags: Vec<Tag>,
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq, Hash)]
+/// Event severity, declared from least to most severe so that levels can be
+/// compared directly (`Level::Warning < Level::Error`).
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq, PartialOrd, Ord, Hash)]
 #[serde(rename_all = "lowercase")]
 pub enum Level {
     Debug,
@@ -37,12 +55,27 @@ pub enum Level {
     Fatal,
 }
 
+impl Level {
+    /// The lowercase name used on the wire, e.g. `"warning"`.
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Level::Debug => "debug",
+            Level::Info => "info",
+            Level::Warning => "warning",
+            Level::Error => "error",
+            Level::Fatal => "fatal",
+        }
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Exception {
     #[serde(rename = "type")]
     pub exception_type: String,
     pub value: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub module: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub stacktrace: Option<Stacktrace>,
 }
 
@@ -54,34 +87,55 @@ pub struct Stacktrace {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Frame {
     pub filename: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub function: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub module: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub lineno: Option<u32>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub colno: Option<u32>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub abs_path: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub context_line: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub pre_context: Option<Vec<String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub post_context: Option<Vec<String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub in_app: Option<bool>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub vars: Option<HashMap<String, String>>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct User {
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub id: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub username: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub email: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub ip_address: Option<String>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Request {
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub url: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub method: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub headers: Option<HashMap<String, String>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub query_string: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub cookies: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub data: Option<serde_json::Value>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub env: Option<HashMap<String, String>>,
 }
 
@@ -176,15 +230,8 @@ impl Event {
     }
 
     pub fn with_severity_tag(mut self, level: &Level) -> Self {
-        let severity = match level {
-            Level::Debug => "debug",
-            Level::Info => "info",
-            Level::Warning => "warning",
-            Level::Error => "error",
-            Level::Fatal => "fatal",
-        };
         self.nostr_tags
-            .push(Tag::parse(vec!["severity", severity]).unwrap());
+            .push(Tag::parse(vec!["severity", level.as_str()]).unwrap());
         self
     }
 
@@ -77,6 +77,7 @@ pub mod encryption;
 pub mod error;
 pub mod event;
 pub mod messaging;
+mod rate_limit;
 
 pub use client::NostrSentryClient;
 pub use config::{Config, EncryptionVersion};
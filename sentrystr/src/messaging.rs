@@ -1,5 +1,6 @@
 use crate::{EncryptionHelper, Event, Result, SentryStrError};
 use chrono::{DateTime, Utc};
+use nostr::nips::nip44::v2::ConversationKey;
 use nostr::prelude::*;
 use nostr_sdk::prelude::*;
 use serde_json;
@@ -24,15 +25,27 @@ pub struct DirectMessageSender {
     client: Client,
     keys: Keys,
     config: DirectMessageConfig,
+    // Derived once for the fixed sender/recipient pair, and only when messages
+    // go out as NIP-44 DMs; NIP-17 gift wraps use a fresh key per message.
+    conversation_key: Option<ConversationKey>,
 }
 
 impl DirectMessageSender {
-    pub fn new(client: Client, keys: Keys, config: DirectMessageConfig) -> Self {
-        Self {
+    pub fn new(client: Client, keys: Keys, config: DirectMessageConfig) -> Result<Self> {
+        let conversation_key = if config.use_nip17 {
+            None
+        } else {
+            Some(EncryptionHelper::conversation_key(
+                keys.secret_key(),
+                &config.recipient_pubkey,
+            )?)
+        };
+        Ok(Self {
             client,
             keys,
             config,
-        }
+            conversation_key,
+        })
     }
 
     pub async fn send_message_for_event(&self, event: &MessageEvent) -> Result<()> {
@@ -40,15 +53,11 @@ impl DirectMessageSender {
             return Ok(());
         }
 
-        let event_json = serde_json::to_string_pretty(&event.event)?;
-        let message_content = format!(
-            "SentryStr Alert\n\nEvent ID: {}\nAuthor: {}\nTimestamp: {}\nLevel: {:?}\n\nEvent Data:\n{}",
-            event.nostr_event_id,
-            event.author,
-            event.event.timestamp,
-            event.event.level,
-            event_json
+        let mut message_content = format!(
+            "SentryStr Alert\n\nEvent ID: {}\nAuthor: {}\nTimestamp: {}\nLevel: {:?}\n\nEvent Data:\n",
+            event.nostr_event_id, event.author, event.event.timestamp, event.event.level,
         );
+        message_content.push_str(&serde_json::to_string_pretty(&event.event)?);
 
         if self.config.use_nip17 {
             self.send_nip17_message(&message_content).await
@@ -66,36 +75,25 @@ impl DirectMessageSender {
     }
 
     fn should_send_for_level(&self, event_level: &crate::Level) -> bool {
-        if let Some(ref min_level) = self.config.min_level {
-            match (min_level, event_level) {
-                (crate::Level::Debug, _) => true,
-                (crate::Level::Info, crate::Level::Debug) => false,
-                (crate::Level::Info, _) => true,
-                (crate::Level::Warning, crate::Level::Debug | crate::Level::Info) => false,
-                (crate::Level::Warning, _) => true,
-                (
-                    crate::Level::Error,
-                    crate::Level::Debug | crate::Level::Info | crate::Level::Warning,
-                ) => false,
-                (crate::Level::Error, _) => true,
-                (crate::Level::Fatal, crate::Level::Fatal) => true,
-                (crate::Level::Fatal, _) => false,
-            }
-        } else {
-            true
-        }
+        self.config
+            .min_level
+            .as_ref()
+            .is_none_or(|min_level| event_level >= min_level)
     }
 
     async fn send_nip17_message(&self, content: &str) -> Result<()> {
         const MAX_RETRIES: u32 = 3;
         const BASE_DELAY_MS: u64 = 1000;
 
+        // Seal and gift-wrap with this sender's own keys rather than the
+        // client's signer, so the client can be a connection shared with a
+        // NostrSentryClient publishing under a different identity.
+        let dm_event =
+            EventBuilder::private_msg(&self.keys, self.config.recipient_pubkey, content, [])
+                .await?;
+
         for attempt in 0..MAX_RETRIES {
-            match self
-                .client
-                .send_private_msg(self.config.recipient_pubkey, content, [])
-                .await
-            {
+            match self.client.send_event(&dm_event).await {
                 Ok(_) => {
                     if attempt > 0 {
                         eprintln!("Successfully sent NIP-17 message after {} retries", attempt);
@@ -122,17 +120,24 @@ impl DirectMessageSender {
         const MAX_RETRIES: u32 = 3;
         const BASE_DELAY_MS: u64 = 1000;
 
-        for attempt in 0..MAX_RETRIES {
-            let encrypted_content = EncryptionHelper::encrypt_nip44(
+        // Encrypt and sign once; a retry resends the same event.
+        let encrypted_content = match self.conversation_key {
+            Some(ref conversation_key) => {
+                EncryptionHelper::encrypt_nip44_with(conversation_key, content)?
+            }
+            // Unset only for NIP-17 senders, which never take this path.
+            None => EncryptionHelper::encrypt_nip44(
                 self.keys.secret_key(),
                 &self.config.recipient_pubkey,
                 content,
-            )?;
+            )?,
+        };
 
-            let dm_event = EventBuilder::new(Kind::EncryptedDirectMessage, encrypted_content)
-                .tag(Tag::public_key(self.config.recipient_pubkey))
-                .sign_with_keys(&self.keys)?;
+        let dm_event = EventBuilder::new(Kind::EncryptedDirectMessage, encrypted_content)
+            .tag(Tag::public_key(self.config.recipient_pubkey))
+            .sign_with_keys(&self.keys)?;
 
+        for attempt in 0..MAX_RETRIES {
             match self.client.send_event(&dm_event).await {
                 Ok(_) => {
                     if attempt > 0 {
@@ -222,7 +227,7 @@ impl DirectMessageBuilder {
             use_nip17: self.use_nip17,
         };
 
-        Ok(DirectMessageSender::new(client, keys, config))
+        DirectMessageSender::new(client, keys, config)
     }
 }
 
@@ -0,0 +1,118 @@
+use std::time::Duration;
+use tokio::sync::Mutex;
+use tokio::time::Instant;
+
+/// Token bucket that paces publishes to a steady rate.
+///
+/// The bucket starts full, so a burst of up to one second's worth of events
+/// goes out immediately; after that, callers of [`RateLimiter::acquire`] wait
+/// their turn. Waiters queue on the inner async mutex, so they are served in
+/// order.
+#[derive(Debug)]
+pub(crate) struct RateLimiter {
+    events_per_sec: f64,
+    capacity: f64,
+    state: Mutex<BucketState>,
+}
+
+#[derive(Debug)]
+struct BucketState {
+    tokens: f64,
+    last_refill: Instant,
+}
+
+impl RateLimiter {
+    pub(crate) fn new(events_per_sec: f64) -> Self {
+        let capacity = events_per_sec.max(1.0);
+        Self {
+            events_per_sec,
+            capacity,
+            state: Mutex::new(BucketState {
+                tokens: capacity,
+                last_refill: Instant::now(),
+            }),
+        }
+    }
+
+    /// Waits until a token is available and takes it.
+    pub(crate) async fn acquire(&self) {
+        let mut state = self.state.lock().await;
+
+        let now = Instant::now();
+        let elapsed = now.duration_since(state.last_refill).as_secs_f64();
+        state.tokens = (state.tokens + elapsed * self.events_per_sec).min(self.capacity);
+        state.last_refill = now;
+
+        if state.tokens < 1.0 {
+            // A vanishingly small (but positive and finite) rate can make the
+            // wait too long for a `Duration`; clamp instead of panicking.
+            let wait = Duration::try_from_secs_f64((1.0 - state.tokens) / self.events_per_sec)
+                .unwrap_or(Duration::MAX);
+            tokio::time::sleep(wait).await;
+            // Sleeping for exactly the deficit refills the single token we take.
+            state.tokens = 1.0;
+            state.last_refill = Instant::now();
+        }
+
+        state.tokens -= 1.0;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Acquires `n` tokens and returns how long after the start each one was
+    /// granted.
+    async fn grant_times(limiter: &RateLimiter, n: usize) -> Vec<Duration> {
+        let start = Instant::now();
+        let mut times = Vec::with_capacity(n);
+        for _ in 0..n {
+            limiter.acquire().await;
+            times.push(start.elapsed());
+        }
+        times
+    }
+
+    fn assert_secs(actual: Duration, expected: f64) {
+        assert!(
+            (actual.as_secs_f64() - expected).abs() < 1e-3,
+            "expected {}s, got {:?}",
+            expected,
+            actual
+        );
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn burst_up_to_capacity_then_paced() {
+        let limiter = RateLimiter::new(4.0);
+        let times = grant_times(&limiter, 7).await;
+
+        for &t in &times[..4] {
+            assert_eq!(t, Duration::ZERO);
+        }
+        assert_secs(times[4], 0.25);
+        assert_secs(times[5], 0.5);
+        assert_secs(times[6], 0.75);
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn rate_below_one_per_second() {
+        // Capacity is floored at one token, so only the first acquire is free.
+        let limiter = RateLimiter::new(0.5);
+        let times = grant_times(&limiter, 3).await;
+
+        assert_eq!(times[0], Duration::ZERO);
+        assert_secs(times[1], 2.0);
+        assert_secs(times[2], 4.0);
+    }
+
+    #[tokio::test(start_paused = true)]
+    async fn tiny_rate_waits_instead_of_panicking() {
+        let limiter = RateLimiter::new(1e-20);
+        limiter.acquire().await;
+
+        let second = tokio::time::timeout(Duration::from_secs(3600), limiter.acquire()).await;
+        assert!(second.is_err());
+    }
+}